@@ -26,6 +26,7 @@ Usage:
 
 import argparse
 import json
+import logging
 import sys
 import os
 from pathlib import Path
@@ -441,6 +442,15 @@ Examples:
 
     args = parser.parse_args()
 
+    # Source modules log progress; show it like the CLI's own prints.
+    # Only the scraper package - third-party INFO logs stay at their defaults.
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    scraper_logger = logging.getLogger('scraper')
+    scraper_logger.addHandler(handler)
+    scraper_logger.setLevel(logging.INFO)
+    scraper_logger.propagate = False
+
     # Initialize database
     init_db()
 
@@ -1,11 +1,15 @@
 """Base scraper infrastructure for Bomagi."""
+import asyncio
 import os
 import re
 import hashlib
+import threading
 import requests
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Generator
+from typing import Optional, List, Dict, Any, Generator, AsyncIterator, Tuple
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from urllib.parse import urlparse
 
 # Image storage path
@@ -49,8 +53,12 @@ ROOM_KEYWORDS = {
 }
 
 
+@lru_cache(maxsize=4096)
 def classify_room_type(text: str) -> Optional[str]:
-    """Classify room type from text (title, description, prompt)."""
+    """Classify room type from text (title, description, prompt).
+
+    Memoized - the same titles recur across category listings and images.
+    """
     if not text:
         return None
 
@@ -143,6 +151,103 @@ def download_image(url: str, source: str, source_id: str) -> Optional[str]:
         return None
 
 
+_loop_lock = threading.Lock()
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def shared_loop() -> asyncio.AbstractEventLoop:
+    """
+    The process-wide event loop async sources run on.
+    Started on first use in a daemon thread, so loop-bound resources (e.g. the
+    shared browser pool) exist once per process whichever thread calls search().
+    """
+    global _shared_loop
+    with _loop_lock:
+        if _shared_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='scraper-async-loop', daemon=True).start()
+            _shared_loop = loop
+    return _shared_loop
+
+
+def _run_on_shared_loop(coro):
+    """Run a coroutine on the shared loop and block the calling thread for its result."""
+    loop = shared_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("synchronous scraper API called from the shared event loop")
+
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result()
+    except BaseException:
+        future.cancel()
+        raise
+
+
+_EXHAUSTED = object()
+
+
+async def _anext(agen: AsyncIterator):
+    try:
+        return await agen.__anext__()
+    except StopAsyncIteration:
+        return _EXHAUSTED
+
+
+def iter_async(agen: AsyncIterator) -> Generator:
+    """
+    Drive an async generator from synchronous code.
+    Steps it on the shared event loop and yields each item as soon as it is
+    produced, so async sources keep the plain generator API of search().
+    """
+    try:
+        while True:
+            item = _run_on_shared_loop(_anext(agen))
+            if item is _EXHAUSTED:
+                break
+            yield item
+    finally:
+        _run_on_shared_loop(agen.aclose())
+
+
+def run_async(coro):
+    """Run a coroutine to completion on the shared event loop."""
+    return _run_on_shared_loop(coro)
+
+
+@dataclass(slots=True, frozen=True)
+class ScrapedItem:
+    """
+    A single search result.
+    Slotted, so sources yielding many results don't pay for a dict each;
+    process_result() turns it into the plain dict the database expects.
+    """
+    source: str
+    source_id: str
+    source_url: str
+    image_url: str
+    thumbnail_url: Optional[str] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    prompt: Optional[str] = None
+    width: int = 0
+    height: int = 0
+    engagement: int = 0
+    style_tags: Optional[Tuple[str, ...]] = None
+
+    def asdict(self) -> Dict[str, Any]:
+        """Plain dict form, with style_tags as a list."""
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        if self.style_tags is not None:
+            data['style_tags'] = list(self.style_tags)
+        return data
+
+
 class BaseSource(ABC):
     """Abstract base class for image sources."""
 
@@ -155,7 +260,7 @@ class BaseSource(ABC):
     @abstractmethod
     def search(self, query: str, room_type: str = None, limit: int = 50) -> Generator[Dict, None, None]:
         """
-        Search for images. Yields dicts with:
+        Search for images. Yields dicts (or ScrapedItem) with:
         - source: str
         - source_id: str
         - source_url: str
@@ -173,6 +278,9 @@ class BaseSource(ABC):
 
     def process_result(self, result: Dict) -> Dict:
         """Post-process a search result with classification and scoring."""
+        if isinstance(result, ScrapedItem):
+            result = result.asdict()
+
         # Classify room type
         text_for_classification = ' '.join(filter(None, [
             result.get('title', ''),
@@ -0,0 +1,121 @@
+"""
+Shared headless Chromium for the async Playwright sources.
+
+Launching Chromium takes seconds, while a fresh BrowserContext is cheap and
+just as isolated (own cookies, cache and storage). Sources ask the pool for
+a context instead of launching their own browser. The sources run on the
+process-wide loop from base.shared_loop(), so one browser serves every
+scrape in the process, from whichever thread it was started.
+"""
+
+import asyncio
+import atexit
+import importlib.util
+from typing import Any, Dict
+
+# Only probe for Playwright here; its import chain costs ~80ms, so it is
+# imported when the first browser is launched rather than at CLI startup
+HAS_PLAYWRIGHT = importlib.util.find_spec('playwright') is not None
+
+
+CONTEXT_DEFAULTS = {
+    'viewport': {'width': 1920, 'height': 1080},
+    'user_agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+}
+
+
+# Resource types the DOM extractors never need - aborting them skips the download and decode
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+
+
+async def block_heavy_resources(page):
+    """Abort image, media, font and stylesheet requests made by the page."""
+    async def handle(route):
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await page.route("**/*", handle)
+
+
+# Upper bound on waiting for new content after a scroll
+SCROLL_WAIT_MS = 2500
+
+
+async def scroll_and_wait(page, selector: str, scroll_js: str, timeout: int = SCROLL_WAIT_MS):
+    """
+    Scroll and return as soon as more elements match selector.
+    Gives up after timeout ms, so a feed that has stopped loading still ends.
+    """
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+    prev = await page.evaluate('(sel) => document.querySelectorAll(sel).length', selector)
+    await page.evaluate(scroll_js)
+    try:
+        await page.wait_for_function(
+            '([sel, prev]) => document.querySelectorAll(sel).length > prev',
+            arg=[selector, prev],
+            timeout=timeout,
+        )
+    except PlaywrightTimeoutError:
+        pass
+
+
+class BrowserPool:
+    """Lazily launches one headless Chromium and hands out fresh contexts."""
+
+    def __init__(self):
+        self._playwright = None
+        self._browser = None
+        self._lock = asyncio.Lock()
+
+    async def acquire_context(self, **options: Any):
+        """Return a new BrowserContext; the caller is responsible for closing it."""
+        async with self._lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    from playwright.async_api import async_playwright
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+
+        return await self._browser.new_context(**{**CONTEXT_DEFAULTS, **options})
+
+    async def close(self):
+        """Close the browser and stop the Playwright driver."""
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+# One pool per event loop - Playwright objects are bound to the loop they were created on
+_pools: Dict[asyncio.AbstractEventLoop, BrowserPool] = {}
+
+
+def get_pool() -> BrowserPool:
+    """Get the browser pool for the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = _pools[loop] = BrowserPool()
+    return pool
+
+
+@atexit.register
+def _close_pools():
+    """Shut down any browsers still running at interpreter exit."""
+    for loop, pool in list(_pools.items()):
+        if loop.is_closed():
+            continue
+        try:
+            if loop.is_running():
+                # The shared loop keeps running in its daemon thread until exit
+                asyncio.run_coroutine_threadsafe(pool.close(), loop).result(timeout=10)
+            else:
+                loop.run_until_complete(pool.close())
+        except Exception:
+            pass
+    _pools.clear()
@@ -3,16 +3,13 @@ Scandinavian furniture brand scrapers.
 High-quality, curated interior photography from real brands.
 """
 
+import importlib.util
 import re
 import time
 from typing import Generator, Dict, Any, List
 from urllib.parse import urljoin, urlparse
 
-try:
-    from playwright.sync_api import sync_playwright
-    HAS_PLAYWRIGHT = True
-except ImportError:
-    HAS_PLAYWRIGHT = False
+HAS_PLAYWRIGHT = importlib.util.find_spec('playwright') is not None
 
 from ..base import BaseSource
 
@@ -63,6 +60,8 @@ class BrandScraperBase(BaseSource):
 
         found = 0
 
+        from playwright.sync_api import sync_playwright
+
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
             context = browser.new_context(
@@ -1,15 +1,12 @@
 """Finn.no source adapter - Norwegian real estate listings."""
+import importlib.util
 import re
 from typing import Generator, Dict, Any, Optional, List
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse, parse_qs
 
-try:
-    from playwright.sync_api import sync_playwright
-    HAS_PLAYWRIGHT = True
-except ImportError:
-    HAS_PLAYWRIGHT = False
+# Only probe for Playwright here; importing it costs ~80ms and happens on first scrape
+HAS_PLAYWRIGHT = importlib.util.find_spec('playwright') is not None
 
-from bs4 import BeautifulSoup
 from ..base import BaseSource
 
 
@@ -36,6 +33,13 @@ class FinnSource(BaseSource):
         'outdoor': ['balkong', 'terrasse', 'uteplass', 'hage', 'veranda'],
     }
 
+    # URL fragments of non-interior images (floor plans, maps, agents, UI)
+    SKIP_PATTERNS = (
+        'floorplan', 'plantegning', 'map', 'kart', 'logo',
+        'agent', 'megler', 'avatar', 'icon', 'thumb'
+    )
+    _SKIP_RE = re.compile('|'.join(map(re.escape, SKIP_PATTERNS)), re.IGNORECASE)
+
     def search(
         self,
         query: str = None,
@@ -56,6 +60,8 @@ class FinnSource(BaseSource):
         found = 0
         page_num = 1
 
+        from playwright.sync_api import sync_playwright
+
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
             context = browser.new_context(
@@ -114,14 +120,14 @@ class FinnSource(BaseSource):
         """Extract listing URLs from search results page."""
         try:
             urls = page.evaluate('''() => {
-                const links = [];
+                const links = new Set();
                 // Finn.no listing links
                 document.querySelectorAll('a[href*="/realestate/homes/ad.html"]').forEach(a => {
-                    if (a.href && !links.includes(a.href)) {
-                        links.push(a.href);
+                    if (a.href) {
+                        links.add(a.href);
                     }
                 });
-                return links.slice(0, 10);  // Limit per page
+                return [...links].slice(0, 10);  // Limit per page
             }''')
             return urls or []
         except Exception:
@@ -145,23 +151,18 @@ class FinnSource(BaseSource):
                 pass
 
             # Extract FINN code for unique ID
-            finn_code = None
-            finn_match = re.search(r'finnkode[=:]?\s*(\d+)', page.content(), re.IGNORECASE)
-            if finn_match:
-                finn_code = finn_match.group(1)
-            else:
-                # Try from URL
-                url_match = re.search(r'finnkode=(\d+)', url)
-                if url_match:
-                    finn_code = url_match.group(1)
+            finn_code = self._extract_finn_code(page, url)
 
             # Get address for context
             address = self._extract_address(page)
 
-            # Extract all images
-            image_data = page.evaluate('''() => {
+            # Extract all images, dropping non-interior ones in the browser
+            image_data = page.evaluate('''(skip) => {
                 const images = [];
                 const seen = new Set();
+                // Position among the images the page used to return before
+                // filtering moved here; source IDs are numbered by it
+                let index = 0;
 
                 // Main gallery images
                 document.querySelectorAll('img').forEach(img => {
@@ -172,8 +173,9 @@ class FinnSource(BaseSource):
                     if (img.width && img.width < 200) return;
                     if (img.height && img.height < 200) return;
 
-                    // Skip non-content images
+                    // These never got an index; the full skip list is applied below
                     if (src.includes('logo') || src.includes('icon') || src.includes('avatar')) return;
+                    const srcLower = src.toLowerCase();
 
                     // Get highest resolution version
                     // Finn.no uses mediatjener with size params
@@ -183,8 +185,13 @@ class FinnSource(BaseSource):
 
                     if (seen.has(src)) return;
                     seen.add(src);
+                    const idx = index++;
+
+                    // Skip non-content images (floor plans, logos, agents)
+                    if (skip.some(p => srcLower.includes(p))) return;
 
                     images.push({
+                        idx: idx,
                         url: src,
                         alt: img.alt || '',
                         width: img.naturalWidth || 0,
@@ -196,9 +203,14 @@ class FinnSource(BaseSource):
                 document.querySelectorAll('[style*="background-image"]').forEach(el => {
                     const style = el.style.backgroundImage;
                     const match = style.match(/url\\(["\']?([^"\'\\)]+)["\']?\\)/);
-                    if (match && match[1] && !seen.has(match[1])) {
-                        seen.add(match[1]);
+                    if (!match || !match[1] || seen.has(match[1])) return;
+                    seen.add(match[1]);
+                    const idx = index++;
+
+                    const urlLower = match[1].toLowerCase();
+                    if (!skip.some(p => urlLower.includes(p))) {
                         images.push({
+                            idx: idx,
                             url: match[1],
                             alt: '',
                             width: 0,
@@ -208,11 +220,12 @@ class FinnSource(BaseSource):
                 });
 
                 return images;
-            }''')
+            }''', list(self.SKIP_PATTERNS))
 
             # Process each image
-            for idx, img in enumerate(image_data or []):
+            for img in image_data or []:
                 img_url = img.get('url', '')
+                # Already filtered in the browser; kept as a safety net
                 if not img_url or not self._is_interior_image(img_url):
                     continue
 
@@ -225,7 +238,7 @@ class FinnSource(BaseSource):
                 if filter_room and room_type != filter_room:
                     continue
 
-                source_id = f"{finn_code}_{idx}" if finn_code else f"finn_{hash(img_url)}"
+                source_id = f"{finn_code}_{img['idx']}" if finn_code else f"finn_{hash(img_url)}"
 
                 images.append({
                     "source": self.name,
@@ -248,6 +261,19 @@ class FinnSource(BaseSource):
 
         return images
 
+    def _extract_finn_code(self, page, url: str) -> Optional[str]:
+        """Get the FINN code from the listing URL, falling back to the DOM."""
+        finn_code = parse_qs(urlparse(url).query).get('finnkode', [None])[0]
+        if finn_code:
+            return finn_code
+
+        try:
+            return page.evaluate(
+                '() => document.querySelector("[data-finnkode]")?.dataset.finnkode || null'
+            )
+        except Exception:
+            return None
+
     def _extract_address(self, page) -> Optional[str]:
         """Extract address from listing page."""
         try:
@@ -281,9 +307,4 @@ class FinnSource(BaseSource):
 
     def _is_interior_image(self, url: str) -> bool:
         """Check if URL is likely an interior photo (not floor plan, map, etc.)."""
-        skip_patterns = [
-            'floorplan', 'plantegning', 'map', 'kart', 'logo',
-            'agent', 'megler', 'avatar', 'icon', 'thumb'
-        ]
-        url_lower = url.lower()
-        return not any(pattern in url_lower for pattern in skip_patterns)
+        return not self._SKIP_RE.search(url)
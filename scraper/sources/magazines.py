@@ -3,15 +3,16 @@ Design magazine and editorial scrapers.
 High-quality interior photography from design publications.
 """
 
+import importlib.util
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Generator, Dict, List
 from urllib.parse import urljoin
 
-try:
-    from playwright.sync_api import sync_playwright
-    HAS_PLAYWRIGHT = True
-except ImportError:
-    HAS_PLAYWRIGHT = False
+# Playwright itself is imported in search(), inside the worker process
+HAS_PLAYWRIGHT = importlib.util.find_spec('playwright') is not None
 
 from ..base import BaseSource
 
@@ -38,6 +39,8 @@ class MagazineScraperBase(BaseSource):
 
         found = 0
 
+        from playwright.sync_api import sync_playwright
+
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
             context = browser.new_context(
@@ -82,10 +85,30 @@ class MagazineScraperBase(BaseSource):
         seen = set()
 
         img_data = page.evaluate('''() => {
+            // Pick the widest candidate from a srcset ("url 800w, url 1600w")
+            const largest = (srcset) => {
+                if (!srcset) return null;
+                const best = [...srcset.matchAll(/(\\S+)\\s+(\\d+)w/g)]
+                    .sort((a, b) => +b[2] - +a[2])[0];
+                const url = best ? best[1] : srcset.split(',').pop().trim().split(' ')[0];
+                try {
+                    return new URL(url, document.baseURI).href;
+                } catch (e) {
+                    return null;
+                }
+            };
+
             const images = [];
             document.querySelectorAll('img').forEach(img => {
-                let src = img.src || img.dataset.src || img.dataset.lazySrc ||
-                          img.getAttribute('data-srcset')?.split(',')[0]?.split(' ')[0];
+                let src = largest(img.srcset) || largest(img.getAttribute('data-srcset')) ||
+                          img.src || img.dataset.src || img.dataset.lazySrc;
+
+                // <picture> keeps the high-res candidates on its <source> elements
+                const pic = img.closest('picture');
+                if (pic) {
+                    const source = pic.querySelector('source[srcset]');
+                    if (source) src = largest(source.srcset) || src;
+                }
                 if (!src) return;
 
                 // Get natural dimensions
@@ -103,6 +126,8 @@ class MagazineScraperBase(BaseSource):
 
                 images.push({
                     src: src,
+                    // What the page rendered - small enough for the curation grid
+                    thumb: img.currentSrc || img.src || src,
                     alt: img.alt || '',
                     width: width,
                     height: height
@@ -125,7 +150,7 @@ class MagazineScraperBase(BaseSource):
                 "source_id": f"{self.name}_{hash(src) % 10**8}",
                 "source_url": source_url,
                 "image_url": src,
-                "thumbnail_url": img['src'],
+                "thumbnail_url": img.get('thumb') or img['src'],
                 "title": f"{self.magazine_name}",
                 "description": img.get('alt', ''),
                 "prompt": None,
@@ -258,6 +283,11 @@ class BoBedreSource(MagazineScraperBase):
     ]
 
 
+def _scrape_magazine(source_class, query: str, room_type: str, limit: int) -> List[Dict]:
+    """Run one magazine scrape to completion (executed in a worker process)."""
+    return list(source_class().search(query=query, room_type=room_type, limit=limit))
+
+
 # Convenience class for all magazines
 class AllMagazinesSource(BaseSource):
     """Scrape from all design magazines."""
@@ -281,22 +311,46 @@ class AllMagazinesSource(BaseSource):
         room_type: str = None,
         limit: int = 50
     ) -> Generator[Dict, None, None]:
-        """Scrape from all magazines."""
+        """
+        Scrape from all magazines.
+        Each magazine runs its own Chromium in a separate process, so the
+        sites are scraped in parallel and results are yielded per magazine
+        as soon as it finishes.
+        """
         per_mag = max(limit // len(self.MAGAZINE_SOURCES), 10)
+        max_workers = min(len(self.MAGAZINE_SOURCES), os.cpu_count() or 1)
         found = 0
 
-        for source_class in self.MAGAZINE_SOURCES:
-            if found >= limit:
-                break
+        # Spawn, not fork: callers (the API threadpool, the shared async loop)
+        # run threads whose held locks a forked child would inherit
+        executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'))
+        try:
+            futures = {
+                executor.submit(_scrape_magazine, source_class, query, room_type, per_mag): source_class
+                for source_class in self.MAGAZINE_SOURCES
+            }
+
+            for future in as_completed(futures):
+                source_class = futures[future]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    print(f"  {source_class.magazine_name}: error: {e}")
+                    continue
+
+                mag_found = 0
+                for result in results:
+                    if found >= limit:
+                        break
+                    found += 1
+                    mag_found += 1
+                    yield result
 
-            source = source_class()
-            mag_found = 0
+                print(f"  {source_class.magazine_name}: {mag_found} images")
 
-            for result in source.search(query=query, room_type=room_type, limit=per_mag):
                 if found >= limit:
                     break
-                found += 1
-                mag_found += 1
-                yield result
-
-            print(f"  {source.magazine_name}: {mag_found} images")
+        finally:
+            # Don't wait for slower magazines once the limit is reached or the
+            # caller stops iterating; queued ones are cancelled
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -1,15 +1,68 @@
 """Midjourney showcase scraper - Browser automation."""
 import re
 import json
-from typing import Generator, Dict, Any, Optional
+import asyncio
+from typing import Generator, Dict, Any, List, Optional
+
+from ..base import BaseSource, ScrapedItem, iter_async
+from ._browser_pool import HAS_PLAYWRIGHT, get_pool, block_heavy_resources, scroll_and_wait
+
+
+# Image extractor installed once per page (add_init_script) and called on every scroll.
+# Filtering and style tagging happen here so only matching images cross back to Python.
+_MIDJOURNEY_EXTRACTOR_JS = '''
+window.__extractImages = ({filters, styles}) => {
+    const images = [];
+
+    // Look for image elements with data attributes
+    document.querySelectorAll('img[src*="cdn.midjourney.com"]').forEach(img => {
+        // Images are blocked, so read attributes rather than the decoded image
+        // (naturalWidth stays 0); width/height give the aspect ratio and the
+        // srcset descriptors the real size
+        const src = img.currentSrc || img.getAttribute('src');
+        const alt = img.alt || '';
+
+        // Try to find parent with more data
+        let parent = img.closest('a, div[class*="image"], div[class*="card"]');
+        let prompt = alt;
+
+        // Check for prompt in nearby elements
+        if (parent) {
+            const promptEl = parent.querySelector('[class*="prompt"], p, span');
+            if (promptEl) {
+                prompt = promptEl.textContent || alt;
+            }
+        }
+
+        if (!src) return;
+
+        // Keep interior-related images only
+        const lower = prompt.toLowerCase();
+        if (!filters.some(term => lower.includes(term))) return;
+
+        // The job ID is parsed from the URL on the Python side (_UUID_RE)
+        images.push({
+            url: src,
+            srcset: img.getAttribute('srcset') || '',
+            width: parseInt(img.getAttribute('width'), 10) || 0,
+            height: parseInt(img.getAttribute('height'), 10) || 0,
+            prompt: prompt,
+            styleTags: styles.filter(word => lower.includes(word))
+        });
+    });
 
-try:
-    from playwright.sync_api import sync_playwright
-    HAS_PLAYWRIGHT = True
-except ImportError:
-    HAS_PLAYWRIGHT = False
+    return images;
+};
+'''
 
-from ..base import BaseSource
+# Feed images - counted to tell when a scroll has loaded more
+_IMAGE_SELECTOR = 'img[src*="cdn.midjourney.com"]'
+
+# Job ID embedded in Midjourney CDN URLs
+_UUID_RE = re.compile(r'([a-f0-9-]{36})', re.I)
+
+# srcset candidate with a width descriptor: "<url> <width>w"
+_SRCSET_RE = re.compile(r'(\S+)\s+(\d+)w')
 
 
 class MidjourneySource(BaseSource):
@@ -27,12 +80,27 @@ class MidjourneySource(BaseSource):
     SHOWCASE_URL = "https://www.midjourney.com/showcase"
     EXPLORE_URL = "https://www.midjourney.com/explore"  # Requires login
 
+    # Showcase feeds scraped concurrently, one browser page each
+    SHOWCASE_FEEDS = (
+        SHOWCASE_URL,
+        "https://www.midjourney.com/showcase/recent/",
+        "https://www.midjourney.com/showcase/top/",
+    )
+    MAX_SCROLLS = 10
+
+    _STYLE_WORDS = (
+        "minimalist", "scandinavian", "modern", "cozy", "rustic",
+        "industrial", "bohemian", "contemporary", "traditional",
+        "mid-century", "art deco", "japanese", "nordic",
+        "warm lighting", "natural light", "architectural"
+    )
+
     def search(
         self,
         query: str = "interior design",
         room_type: str = None,
         limit: int = 50
-    ) -> Generator[Dict, None, None]:
+    ) -> Generator[ScrapedItem, None, None]:
         """
         Scrape Midjourney showcase for interior images.
         Since there's no search on showcase, we scrape and filter locally.
@@ -48,95 +116,85 @@ class MidjourneySource(BaseSource):
         if room_type:
             filter_terms.append(room_type.replace('_', ' '))
 
+        yield from iter_async(self._search_async(filter_terms, limit))
+
+    async def _search_async(self, filter_terms: List[str], limit: int):
+        """Scrape all showcase feeds concurrently, yielding unique results."""
         found = 0
+        seen_ids = set()
+        queue = asyncio.Queue()
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            )
-            page = context.new_page()
-
-            try:
-                print(f"  Loading Midjourney showcase...")
-                page.goto(self.SHOWCASE_URL, wait_until='networkidle', timeout=30000)
-                page.wait_for_timeout(3000)
-
-                # Scroll to load more images
-                scroll_count = 0
-                max_scrolls = 10
-
-                while found < limit and scroll_count < max_scrolls:
-                    # Extract visible images
-                    images = self._extract_images_from_page(page)
-
-                    for img_data in images:
-                        if found >= limit:
-                            break
-
-                        # Filter for interior-related images
-                        prompt = (img_data.get('prompt') or '').lower()
-                        if any(term in prompt for term in filter_terms):
-                            result = self._parse_image(img_data)
-                            if result:
-                                found += 1
-                                yield result
-
-                    # Scroll down for more
-                    page.evaluate('window.scrollBy(0, window.innerHeight)')
-                    page.wait_for_timeout(2000)
-                    scroll_count += 1
-
-            except Exception as e:
-                print(f"Midjourney scrape error: {e}")
-            finally:
-                browser.close()
-
-    def _extract_images_from_page(self, page) -> list:
+        pool = get_pool()
+        tasks = [
+            asyncio.create_task(self._scrape_feed(pool, url, filter_terms, limit, queue))
+            for url in self.SHOWCASE_FEEDS
+        ]
+
+        try:
+            running = len(tasks)
+            while running and found < limit:
+                result = await queue.get()
+                if result is None:  # A feed finished
+                    running -= 1
+                    continue
+                if result.source_id in seen_ids:
+                    continue
+                seen_ids.add(result.source_id)
+                found += 1
+                yield result
+
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _scrape_feed(self, pool, url: str, filter_terms: List[str], limit: int, queue: asyncio.Queue):
+        """Scroll one showcase feed, putting matching results on the queue."""
+        context = None
+
+        try:
+            context = await pool.acquire_context()
+            page = await context.new_page()
+            await block_heavy_resources(page)
+            await page.add_init_script(script=_MIDJOURNEY_EXTRACTOR_JS)
+
+            print(f"  Loading Midjourney showcase: {url}")
+            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+            await asyncio.sleep(3)
+
+            extract_args = {"filters": filter_terms, "styles": list(self._STYLE_WORDS)}
+            found = 0
+            for _ in range(self.MAX_SCROLLS):
+                # Extract visible interior-related images
+                images = await self._extract_images_from_page(page, extract_args)
+
+                for img_data in images:
+                    if found >= limit:
+                        return
+
+                    result = self._parse_image(img_data)
+                    if result:
+                        found += 1
+                        await queue.put(result)
+
+                # Scroll down for more
+                await scroll_and_wait(page, _IMAGE_SELECTOR, 'window.scrollBy(0, window.innerHeight)')
+
+        except Exception as e:
+            print(f"Midjourney scrape error ({url}): {e}")
+        finally:
+            if context is not None:
+                await context.close()
+            await queue.put(None)
+
+    async def _extract_images_from_page(self, page, args: Dict[str, Any]) -> list:
         """Extract image data from current page state."""
         try:
             # Midjourney uses a specific data structure in their React app
             # Try to extract from __NEXT_DATA__ or visible elements
 
-            # Method 1: Try to get from page's JavaScript state
-            data = page.evaluate('''() => {
-                const images = [];
-
-                // Look for image elements with data attributes
-                document.querySelectorAll('img[src*="cdn.midjourney.com"]').forEach(img => {
-                    const src = img.src;
-                    const alt = img.alt || '';
-
-                    // Try to find parent with more data
-                    let parent = img.closest('a, div[class*="image"], div[class*="card"]');
-                    let prompt = alt;
-
-                    // Check for prompt in nearby elements
-                    if (parent) {
-                        const promptEl = parent.querySelector('[class*="prompt"], p, span');
-                        if (promptEl) {
-                            prompt = promptEl.textContent || alt;
-                        }
-                    }
-
-                    // Extract ID from URL
-                    const idMatch = src.match(/([a-f0-9-]{36})/i);
-                    const id = idMatch ? idMatch[1] : null;
-
-                    if (id && src) {
-                        images.push({
-                            id: id,
-                            url: src,
-                            prompt: prompt,
-                            width: img.naturalWidth || 0,
-                            height: img.naturalHeight || 0
-                        });
-                    }
-                });
-
-                return images;
-            }''')
+            # Method 1: Try to get from page's JavaScript state (see _MIDJOURNEY_EXTRACTOR_JS)
+            data = await page.evaluate('(args) => window.__extractImages(args)', args)
 
             return data or []
 
@@ -144,45 +202,51 @@ class MidjourneySource(BaseSource):
             print(f"Error extracting images: {e}")
             return []
 
-    def _parse_image(self, item: Dict) -> Optional[Dict[str, Any]]:
-        """Parse extracted image data into our format."""
+    def _parse_image(self, item: Dict) -> Optional[ScrapedItem]:
+        """Parse extracted (already filtered and tagged) image data into our format."""
         try:
-            image_id = item.get("id", "")
-            if not image_id:
-                return None
+            # currentSrc/src - the rendered size, kept as the thumbnail
+            image_url = thumbnail_url = item.get("url", "")
+            width = item.get("width") or 0
+            height = item.get("height") or 0
+
+            # Prefer the widest srcset candidate; its descriptor gives the width,
+            # and the width/height attributes the aspect ratio to scale by
+            candidates = _SRCSET_RE.findall(item.get("srcset") or "")
+            if candidates:
+                best_url, best_width = max(candidates, key=lambda c: int(c[1]))
+                image_url = best_url.strip(',')
+                if width and height:
+                    width, height = int(best_width), round(int(best_width) * height / width)
+                else:
+                    # A width alone can't be scored (quality uses the smaller side)
+                    width = height = 0
 
-            image_url = item.get("url", "")
             if not image_url:
                 return None
 
-            prompt = item.get("prompt", "")
+            id_match = _UUID_RE.search(image_url)
+            if not id_match:
+                return None
+            image_id = id_match.group(1)
 
-            # Extract style tags
-            tags = []
-            if prompt:
-                style_words = [
-                    "minimalist", "scandinavian", "modern", "cozy", "rustic",
-                    "industrial", "bohemian", "contemporary", "traditional",
-                    "mid-century", "art deco", "japanese", "nordic",
-                    "warm lighting", "natural light", "architectural"
-                ]
-                prompt_lower = prompt.lower()
-                tags = [w for w in style_words if w in prompt_lower]
-
-            return {
-                "source": self.name,
-                "source_id": image_id,
-                "source_url": f"https://www.midjourney.com/jobs/{image_id}",
-                "image_url": image_url,
-                "thumbnail_url": image_url,
-                "title": None,
-                "description": None,
-                "prompt": prompt[:2000] if prompt else None,
-                "width": item.get("width", 0),
-                "height": item.get("height", 0),
-                "engagement": 0,  # Not available from showcase
-                "style_tags": tags if tags else None,
-            }
+            prompt = item.get("prompt", "")
+            tags = item.get("styleTags")
+
+            return ScrapedItem(
+                source=self.name,
+                source_id=image_id,
+                source_url=f"https://www.midjourney.com/jobs/{image_id}",
+                image_url=image_url,
+                thumbnail_url=thumbnail_url or image_url,
+                title=None,
+                description=None,
+                prompt=prompt[:2000] if prompt else None,
+                width=width,
+                height=height,
+                engagement=0,  # Not available from showcase
+                style_tags=tuple(tags) if tags else None,
+            )
 
         except Exception as e:
             print(f"Error parsing Midjourney item: {e}")
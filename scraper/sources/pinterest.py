@@ -7,25 +7,80 @@ Methods:
 3. Direct Scraping - Playwright-based (risky, may get blocked)
 """
 
+import importlib.util
 import json
+import multiprocessing
 import re
 import os
+import time
+import asyncio
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from typing import Generator, Dict, Any, Optional, List
 from pathlib import Path
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
 
+# ijson is only needed for HAR import, so it is imported on first use
+HAS_IJSON = importlib.util.find_spec('ijson') is not None
+
+# orjson parses bytes or str directly and is several times faster on large
+# payloads; its decode error subclasses json.JSONDecodeError
 try:
-    from playwright.sync_api import sync_playwright
-    HAS_PLAYWRIGHT = True
+    import orjson
+    _loads = orjson.loads
 except ImportError:
-    HAS_PLAYWRIGHT = False
+    _loads = json.loads
+
+from ..base import BaseSource, ScrapedItem, iter_async
+from ._browser_pool import HAS_PLAYWRIGHT, get_pool, block_heavy_resources, scroll_and_wait
+
+# Size segment of pinimg.com URLs (e.g. /236x/), swapped for /originals/
+_PIN_SIZE_RE = re.compile(r'/\d+x/')
+
+# Pin image sizes, largest first, and the ones used as thumbnails
+_IMAGE_SIZES = ('orig', '736x', '564x', '474x', '236x')
+_THUMBNAIL_SIZES = ('236x', '474x')
+
+
+def _pin_key(pin_id: str):
+    """Compact dedup key - numeric pin IDs are stored as ints, about half the size of the str."""
+    return int(pin_id) if pin_id.isdecimal() else pin_id
+
+
+# Search grid pins - counted to tell when a scroll has loaded more
+_PIN_SELECTOR = '[data-test-id="pin"]'
 
-from ..base import BaseSource
+# Pin extractor installed once per page (add_init_script) and called on every scroll
+_PINTEREST_EXTRACTOR_JS = '''
+window.__extractPins = () => {
+    const pins = [];
+    document.querySelectorAll('[data-test-id="pin"]').forEach(el => {
+        const link = el.querySelector('a[href*="/pin/"]');
+        const img = el.querySelector('img');
+
+        if (link && img) {
+            const href = link.getAttribute('href');
+            const idMatch = href.match(/\\/pin\\/(\\d+)/);
+
+            if (idMatch) {
+                pins.push({
+                    id: idMatch[1],
+                    url: img.src,
+                    alt: img.alt || ''
+                });
+            }
+        }
+    });
+    return pins;
+};
+'''
 
 
 class PinterestHARSource(BaseSource):
@@ -55,7 +110,7 @@ class PinterestHARSource(BaseSource):
         room_type: str = None,
         limit: int = 50,
         har_path: str = None
-    ) -> Generator[Dict, None, None]:
+    ) -> Generator[ScrapedItem, None, None]:
         """
         Extract Pinterest images from a HAR file.
         The query parameter is ignored - we extract all images from the HAR.
@@ -72,82 +127,114 @@ class PinterestHARSource(BaseSource):
 
         print(f"  Parsing HAR file: {har_file}")
 
+        found = 0
+        seen_ids = set()
+
         try:
-            with open(har_file, 'r', encoding='utf-8') as f:
-                har_data = json.load(f)
+            for pins in self._parse_responses(self._iter_response_texts(har_file)):
+                for pin in pins:
+                    if found >= limit:
+                        return
+                    key = _pin_key(pin.source_id)
+                    if key not in seen_ids:
+                        seen_ids.add(key)
+                        found += 1
+                        yield pin
         except Exception as e:
             print(f"  Error reading HAR file: {e}")
+
+    def _parse_responses(self, texts) -> Generator[List[ScrapedItem], None, None]:
+        """
+        Decode response bodies into pins, in HAR order.
+        Decoding is CPU-bound, so bodies are fanned out to worker processes with
+        a bounded number in flight; the HAR is still streamed by this process.
+        """
+        workers = self.config.get('har_workers') or os.cpu_count() or 1
+        if workers <= 1:
+            for text in texts:
+                yield _parse_response_text(text)
             return
 
-        entries = har_data.get('log', {}).get('entries', [])
-        found = 0
-        seen_ids = set()
+        # Spawn rather than fork - this can run in a threaded process (API server,
+        # shared async loop), and a forked child can inherit another thread's locks
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+        pending = deque()
+        try:
+            for text in texts:
+                pending.append(executor.submit(_parse_response_text, text))
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Stop early once the limit is hit instead of decoding the rest
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _iter_response_texts(self, har_file: str) -> Generator[str, None, None]:
+        """Yield the bodies of successful Pinterest JSON responses in the HAR."""
+        if HAS_IJSON:
+            yield from self._stream_response_texts(har_file)
+            return
 
-        for entry in entries:
-            if found >= limit:
-                break
+        with open(har_file, 'rb') as f:
+            har_data = _loads(f.read())
 
+        for entry in har_data.get('log', {}).get('entries', []):
             request = entry.get('request', {})
             response = entry.get('response', {})
-            url = request.get('url', '')
-
-            # Look for Pinterest API responses containing pin data
-            if 'pinterest.com' in url and response.get('status') == 200:
-                content = response.get('content', {})
-                mime_type = content.get('mimeType', '')
-
-                if 'json' in mime_type:
-                    text = content.get('text', '')
-                    if text:
-                        pins = self._extract_pins_from_json(text)
-                        for pin in pins:
-                            if found >= limit:
-                                break
-                            if pin['source_id'] not in seen_ids:
-                                seen_ids.add(pin['source_id'])
-                                found += 1
-                                yield pin
-
-    def _extract_pins_from_json(self, json_text: str) -> List[Dict]:
-        """Extract pin data from Pinterest API JSON response."""
-        pins = []
-
-        try:
-            data = json.loads(json_text)
-        except json.JSONDecodeError:
-            return pins
+            content = response.get('content', {})
+            text = content.get('text', '')
+            if text and _is_pin_response(request.get('url', ''), response.get('status'), content.get('mimeType', '')):
+                yield text
 
-        # Pinterest API responses have various structures
-        # Look for common patterns containing pin data
-        self._find_pins_recursive(data, pins)
-
-        return pins
-
-    def _find_pins_recursive(self, obj: Any, pins: List[Dict], depth: int = 0):
-        """Recursively search for pin objects in nested JSON."""
-        if depth > 10:  # Prevent infinite recursion
-            return
-
-        if isinstance(obj, dict):
-            # Check if this looks like a pin object
-            if 'id' in obj and 'images' in obj:
-                pin = self._parse_pin(obj)
-                if pin:
-                    pins.append(pin)
-            elif 'id' in obj and 'image_signature' in obj:
-                pin = self._parse_pin(obj)
-                if pin:
-                    pins.append(pin)
-            else:
-                # Recurse into dict values
-                for value in obj.values():
-                    self._find_pins_recursive(value, pins, depth + 1)
-
-        elif isinstance(obj, list):
-            for item in obj:
-                self._find_pins_recursive(item, pins, depth + 1)
-
-    def _parse_pin(self, pin_data: Dict) -> Optional[Dict]:
+    @staticmethod
+    def _stream_response_texts(har_file: str) -> Generator[str, None, None]:
+        """
+        Stream the HAR as ijson events, keeping only the four fields the filter reads.
+        HARs embed every response body and can be hundreds of MB; headers, timings
+        and the bodies of non-JSON entries (images, scripts) are dropped as they
+        are read instead of being built into entry dicts.
+        """
+        import ijson
+
+        url = status = mime_type = text = None
+        with open(har_file, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == 'log.entries.item':
+                    if event == 'start_map':
+                        url = status = mime_type = text = None
+                    elif event == 'end_map' and text and _is_pin_response(url or '', status, mime_type or ''):
+                        yield text
+                elif prefix == 'log.entries.item.request.url':
+                    url = value
+                elif prefix == 'log.entries.item.response.status':
+                    status = value
+                elif prefix == 'log.entries.item.response.content.mimeType':
+                    mime_type = value
+                elif prefix == 'log.entries.item.response.content.text':
+                    # Keep the body unless a field already read rules the entry out
+                    # (mimeType normally precedes text, so images are dropped here)
+                    if _is_pin_response(url or 'pinterest.com', 200 if status is None else status,
+                                        'json' if mime_type is None else mime_type):
+                        text = value
+
+    @staticmethod
+    def _iter_pins(obj: Any) -> Generator[Dict, None, None]:
+        """Yield pin objects found anywhere in nested JSON, in document order."""
+        stack = [obj]
+        while stack:
+            cur = stack.pop()
+            if isinstance(cur, dict):
+                # Check if this looks like a pin object
+                if 'id' in cur and ('images' in cur or 'image_signature' in cur):
+                    yield cur
+                else:
+                    stack.extend(reversed(cur.values()))
+            elif isinstance(cur, list):
+                stack.extend(reversed(cur))
+
+    @staticmethod
+    def _parse_pin(pin_data: Dict) -> Optional[ScrapedItem]:
         """Parse a Pinterest pin object into our format."""
         try:
             pin_id = str(pin_data.get('id', ''))
@@ -155,20 +242,19 @@ class PinterestHARSource(BaseSource):
                 return None
 
             # Get image URL - Pinterest has multiple image sizes
-            images = pin_data.get('images', {})
-            image_url = None
-            thumbnail_url = None
-
-            # Try to get the largest image
-            for size_key in ['orig', '736x', '564x', '474x', '236x']:
-                if size_key in images:
-                    img_data = images[size_key]
-                    if isinstance(img_data, dict):
-                        image_url = img_data.get('url')
-                        break
-                    elif isinstance(img_data, str):
-                        image_url = img_data
-                        break
+            images = pin_data.get('images') or {}
+            sizes = {key: images[key] for key in _IMAGE_SIZES if key in images}
+
+            # Largest image first; thumbnails come from the same lookup
+            image_url = next((
+                img_data.get('url') if isinstance(img_data, dict) else img_data
+                for img_data in sizes.values()
+                if isinstance(img_data, (dict, str))
+            ), None)
+            thumbnail_url = next((
+                sizes[key].get('url') for key in _THUMBNAIL_SIZES
+                if isinstance(sizes.get(key), dict)
+            ), None)
 
             # Alternative: construct URL from image_signature
             if not image_url and 'image_signature' in pin_data:
@@ -178,14 +264,6 @@ class PinterestHARSource(BaseSource):
             if not image_url:
                 return None
 
-            # Get thumbnail
-            for size_key in ['236x', '474x']:
-                if size_key in images:
-                    img_data = images[size_key]
-                    if isinstance(img_data, dict):
-                        thumbnail_url = img_data.get('url')
-                        break
-
             # Get description/title
             description = pin_data.get('description', '') or pin_data.get('title', '')
             grid_title = pin_data.get('grid_title', '')
@@ -200,25 +278,50 @@ class PinterestHARSource(BaseSource):
             comment_count = pin_data.get('comment_count', 0) or 0
             engagement = repin_count + like_count + comment_count
 
-            return {
-                "source": "pinterest",
-                "source_id": pin_id,
-                "source_url": f"https://pinterest.com/pin/{pin_id}/",
-                "image_url": image_url,
-                "thumbnail_url": thumbnail_url or image_url,
-                "title": grid_title or board_name,
-                "description": description[:500] if description else None,
-                "prompt": None,  # Real photos, no prompt
-                "width": 0,  # Not always available
-                "height": 0,
-                "engagement": engagement,
-                "style_tags": None,
-            }
+            return ScrapedItem(
+                source="pinterest",
+                source_id=pin_id,
+                source_url=f"https://pinterest.com/pin/{pin_id}/",
+                image_url=image_url,
+                thumbnail_url=thumbnail_url or image_url,
+                title=grid_title or board_name,
+                description=description[:500] if description else None,
+                prompt=None,  # Real photos, no prompt
+                width=0,  # Not always available
+                height=0,
+                engagement=engagement,
+                style_tags=None,
+            )
 
         except Exception as e:
             return None
 
 
+def _is_pin_response(url: str, status: Any, mime_type: str) -> bool:
+    """Whether a HAR entry is a successful Pinterest API response that can hold pins."""
+    return 'pinterest.com' in url and status == 200 and 'json' in mime_type
+
+
+def _parse_response_text(json_text: str) -> List[ScrapedItem]:
+    """
+    Decode one Pinterest API response body into pins.
+    Module-level so ProcessPoolExecutor workers can pickle a reference to it.
+    """
+    try:
+        data = _loads(json_text)
+    except json.JSONDecodeError:
+        return []
+
+    # Pinterest API responses have various structures
+    # Look for common patterns containing pin data
+    pins = []
+    for pin_data in PinterestHARSource._iter_pins(data):
+        pin = PinterestHARSource._parse_pin(pin_data)
+        if pin:
+            pins.append(pin)
+    return pins
+
+
 class PinterestApifySource(BaseSource):
     """
     Pinterest source using Apify's Pinterest Scraper.
@@ -233,17 +336,67 @@ class PinterestApifySource(BaseSource):
 
     APIFY_ACTOR = "alexey/pinterest-crawler"
     APIFY_API_URL = "https://api.apify.com/v2"
+    WAIT_FOR_FINISH = 60  # Max seconds Apify holds a status request open
+    REQUEST_TIMEOUT = 60
+
+    # Transient Apify/proxy failures are retried with exponential backoff
+    # (0.5s, 1s, 2s, ...), honouring Retry-After on 429/503
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    MAX_RETRIES = 5
 
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
         self.api_token = (config or {}).get('apify_token') or os.environ.get('APIFY_TOKEN')
 
+        # One keep-alive session for the start/poll/fetch calls of a run
+        self._http = None
+        if HAS_REQUESTS:
+            self._http = requests.Session()
+            self._http.headers['Accept'] = 'application/json'
+            self._http.params = {"token": self.api_token}
+            retry = Retry(
+                total=self.MAX_RETRIES,
+                backoff_factor=0.5,
+                status_forcelist=self.RETRY_STATUSES,
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(max_retries=retry)
+            self._http.mount("https://", adapter)
+            self._http.mount("http://", adapter)
+
+    def close(self):
+        """Close the HTTP session."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _get(self, path: str, **kwargs):
+        """GET an Apify API path; retries are handled by the session adapter."""
+        kwargs.setdefault('timeout', self.REQUEST_TIMEOUT)
+        response = self._http.get(f"{self.APIFY_API_URL}{path}", **kwargs)
+        response.raise_for_status()
+        return response
+
+    def _post(self, path: str, **kwargs):
+        """POST to an Apify API path."""
+        kwargs.setdefault('timeout', self.REQUEST_TIMEOUT)
+        response = self._http.post(f"{self.APIFY_API_URL}{path}", **kwargs)
+        response.raise_for_status()
+        return response
+
     def search(
         self,
         query: str = "scandinavian interior design",
         room_type: str = None,
         limit: int = 50
-    ) -> Generator[Dict, None, None]:
+    ) -> Generator[ScrapedItem, None, None]:
         """
         Search Pinterest via Apify actor.
         """
@@ -272,25 +425,20 @@ class PinterestApifySource(BaseSource):
         try:
             # Start actor
             print(f"  Starting Apify Pinterest scraper for: {search_query}")
-            response = requests.post(
-                f"{self.APIFY_API_URL}/acts/{self.APIFY_ACTOR}/runs",
-                params={"token": self.api_token},
-                json=run_input,
-                timeout=30
-            )
-            response.raise_for_status()
-            run_data = response.json()
+            response = self._post(f"/acts/{self.APIFY_ACTOR}/runs", json=run_input, timeout=30)
+            run_data = _loads(response.content)
             run_id = run_data['data']['id']
 
-            # Wait for completion (poll)
-            import time
+            # Wait for completion - waitForFinish makes Apify hold the request
+            # open until the run ends (up to WAIT_FOR_FINISH seconds)
+            delay = 0.5
             while True:
-                status_response = requests.get(
-                    f"{self.APIFY_API_URL}/actor-runs/{run_id}",
-                    params={"token": self.api_token},
-                    timeout=30
+                status_response = self._get(
+                    f"/actor-runs/{run_id}",
+                    params={"waitForFinish": self.WAIT_FOR_FINISH},
+                    timeout=self.WAIT_FOR_FINISH + 30
                 )
-                status_data = status_response.json()
+                status_data = _loads(status_response.content)
                 status = status_data['data']['status']
 
                 if status == 'SUCCEEDED':
@@ -299,27 +447,28 @@ class PinterestApifySource(BaseSource):
                     print(f"  Apify run failed with status: {status}")
                     return
 
-                time.sleep(5)
+                # Back off in case the server returned early
+                time.sleep(delay)
+                delay = min(delay * 1.6, 10.0)
 
-            # Get results
+            # Stream results - JSONL lets us yield pins while the body is still arriving
             dataset_id = status_data['data']['defaultDatasetId']
-            results_response = requests.get(
-                f"{self.APIFY_API_URL}/datasets/{dataset_id}/items",
-                params={"token": self.api_token, "format": "json"},
-                timeout=60
-            )
-            results = results_response.json()
-
-            # Yield results
-            for item in results:
-                pin = self._parse_apify_result(item)
-                if pin:
-                    yield pin
+            with self._get(
+                f"/datasets/{dataset_id}/items",
+                params={"format": "jsonl"},
+                stream=True
+            ) as results_response:
+                for line in results_response.iter_lines():
+                    if not line:
+                        continue
+                    pin = self._parse_apify_result(_loads(line))
+                    if pin:
+                        yield pin
 
         except Exception as e:
             print(f"  Apify error: {e}")
 
-    def _parse_apify_result(self, item: Dict) -> Optional[Dict]:
+    def _parse_apify_result(self, item: Dict) -> Optional[ScrapedItem]:
         """Parse Apify scraper result into our format."""
         try:
             pin_id = str(item.get('id', ''))
@@ -330,20 +479,20 @@ class PinterestApifySource(BaseSource):
             if not image_url:
                 return None
 
-            return {
-                "source": "pinterest",
-                "source_id": pin_id,
-                "source_url": item.get('url') or f"https://pinterest.com/pin/{pin_id}/",
-                "image_url": image_url,
-                "thumbnail_url": item.get('images', {}).get('236x', {}).get('url') or image_url,
-                "title": item.get('title'),
-                "description": item.get('description'),
-                "prompt": None,
-                "width": item.get('images', {}).get('orig', {}).get('width', 0),
-                "height": item.get('images', {}).get('orig', {}).get('height', 0),
-                "engagement": (item.get('saves', 0) or 0) + (item.get('comments', 0) or 0),
-                "style_tags": None,
-            }
+            return ScrapedItem(
+                source="pinterest",
+                source_id=pin_id,
+                source_url=item.get('url') or f"https://pinterest.com/pin/{pin_id}/",
+                image_url=image_url,
+                thumbnail_url=item.get('images', {}).get('236x', {}).get('url') or image_url,
+                title=item.get('title'),
+                description=item.get('description'),
+                prompt=None,
+                width=item.get('images', {}).get('orig', {}).get('width', 0),
+                height=item.get('images', {}).get('orig', {}).get('height', 0),
+                engagement=(item.get('saves', 0) or 0) + (item.get('comments', 0) or 0),
+                style_tags=None,
+            )
         except Exception:
             return None
 
@@ -359,12 +508,16 @@ class PinterestDirectSource(BaseSource):
     name = "pinterest_direct"
     requires_auth = False
 
+    # Query variants searched concurrently, one browser page each
+    QUERY_SUFFIXES = ("", " ideas", " inspiration")
+    PINS_PER_SCROLL = 20
+
     def search(
         self,
         query: str = "scandinavian interior design",
         room_type: str = None,
         limit: int = 50
-    ) -> Generator[Dict, None, None]:
+    ) -> Generator[ScrapedItem, None, None]:
         """
         Directly scrape Pinterest search results.
         """
@@ -376,95 +529,94 @@ class PinterestDirectSource(BaseSource):
         if room_type:
             search_query = f"{room_type.replace('_', ' ')} {query}"
 
-        search_url = f"https://www.pinterest.com/search/pins/?q={search_query.replace(' ', '%20')}"
+        yield from iter_async(self._search_async(search_query, limit))
 
+    async def _search_async(self, search_query: str, limit: int):
+        """Scrape all query variants concurrently, yielding unique pins."""
         found = 0
+        seen_ids = set()
+        queue = asyncio.Queue()
+        max_scrolls = max(1, limit // self.PINS_PER_SCROLL)
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            )
-            page = context.new_page()
-
-            try:
-                print(f"  Loading Pinterest search: {search_query}")
-                page.goto(search_url, wait_until='networkidle', timeout=30000)
-                page.wait_for_timeout(3000)
-
-                # Scroll to load more pins
-                scroll_count = 0
-                max_scrolls = limit // 20  # Roughly 20 pins per scroll
-
-                seen_ids = set()
-
-                while found < limit and scroll_count < max_scrolls:
-                    # Extract pins from current view
-                    pins_data = page.evaluate('''() => {
-                        const pins = [];
-                        document.querySelectorAll('[data-test-id="pin"]').forEach(el => {
-                            const link = el.querySelector('a[href*="/pin/"]');
-                            const img = el.querySelector('img');
-
-                            if (link && img) {
-                                const href = link.getAttribute('href');
-                                const idMatch = href.match(/\\/pin\\/(\\d+)/);
-
-                                if (idMatch) {
-                                    pins.push({
-                                        id: idMatch[1],
-                                        url: img.src,
-                                        alt: img.alt || ''
-                                    });
-                                }
-                            }
-                        });
-                        return pins;
-                    }''')
-
-                    for pin in pins_data:
-                        if found >= limit:
-                            break
-                        if pin['id'] not in seen_ids:
-                            seen_ids.add(pin['id'])
-
-                            # Upgrade to high-res URL
-                            image_url = pin['url']
-                            if 'pinimg.com' in image_url:
-                                # Replace size indicator with 'originals'
-                                image_url = re.sub(
-                                    r'/\d+x/',
-                                    '/originals/',
-                                    image_url
-                                )
-
-                            result = {
-                                "source": "pinterest",
-                                "source_id": pin['id'],
-                                "source_url": f"https://pinterest.com/pin/{pin['id']}/",
-                                "image_url": image_url,
-                                "thumbnail_url": pin['url'],
-                                "title": None,
-                                "description": pin['alt'],
-                                "prompt": None,
-                                "width": 0,
-                                "height": 0,
-                                "engagement": 0,
-                                "style_tags": None,
-                            }
-                            found += 1
-                            yield result
-
-                    # Scroll down
-                    page.evaluate('window.scrollBy(0, window.innerHeight * 2)')
-                    page.wait_for_timeout(2000)
-                    scroll_count += 1
-
-            except Exception as e:
-                print(f"  Pinterest scrape error: {e}")
-            finally:
-                browser.close()
+        pool = get_pool()
+        tasks = [
+            asyncio.create_task(self._scrape_query(pool, search_query + suffix, max_scrolls, queue))
+            for suffix in self.QUERY_SUFFIXES
+        ]
+
+        try:
+            running = len(tasks)
+            while running and found < limit:
+                result = await queue.get()
+                if result is None:  # A query variant finished
+                    running -= 1
+                    continue
+                key = _pin_key(result.source_id)
+                if key in seen_ids:
+                    continue
+                seen_ids.add(key)
+                found += 1
+                yield result
+
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _scrape_query(self, pool, search_query: str, max_scrolls: int, queue: asyncio.Queue):
+        """Scroll one Pinterest search, putting every pin seen on the queue."""
+        search_url = f"https://www.pinterest.com/search/pins/?q={search_query.replace(' ', '%20')}"
+        context = None
+
+        try:
+            context = await pool.acquire_context()
+            page = await context.new_page()
+            await block_heavy_resources(page)
+            await page.add_init_script(script=_PINTEREST_EXTRACTOR_JS)
+
+            print(f"  Loading Pinterest search: {search_query}")
+            await page.goto(search_url, wait_until='domcontentloaded', timeout=30000)
+            await asyncio.sleep(3)
+
+            for _ in range(max_scrolls):
+                # Extract pins from current view
+                pins_data = await page.evaluate('window.__extractPins()')
+
+                for pin in pins_data:
+                    await queue.put(self._parse_pin(pin))
+
+                # Scroll down
+                await scroll_and_wait(page, _PIN_SELECTOR, 'window.scrollBy(0, window.innerHeight * 2)')
+
+        except Exception as e:
+            print(f"  Pinterest scrape error ({search_query}): {e}")
+        finally:
+            if context is not None:
+                await context.close()
+            await queue.put(None)
+
+    def _parse_pin(self, pin: Dict) -> ScrapedItem:
+        """Convert a pin scraped from the search grid into our format."""
+        # Upgrade to high-res URL
+        image_url = pin['url']
+        if 'pinimg.com' in image_url:
+            # Replace size indicator with 'originals'
+            image_url = _PIN_SIZE_RE.sub('/originals/', image_url)
+
+        return ScrapedItem(
+            source="pinterest",
+            source_id=pin['id'],
+            source_url=f"https://pinterest.com/pin/{pin['id']}/",
+            image_url=image_url,
+            thumbnail_url=pin['url'],
+            title=None,
+            description=pin['alt'],
+            prompt=None,
+            width=0,
+            height=0,
+            engagement=0,
+            style_tags=None,
+        )
 
 
 # Convenience alias - use HAR method by default
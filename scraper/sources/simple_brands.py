@@ -1,23 +1,245 @@
 """
-Simple brand scrapers using requests + BeautifulSoup
+Simple brand scrapers using requests + lxml
 No Playwright required - uses RSS feeds, sitemaps, and static HTML
 """
 
+import asyncio
+import importlib.util
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from hashlib import blake2b
+from pathlib import Path
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml.cssselect import CSSSelector
 import re
-from typing import Generator, Dict, Any, Optional
-from urllib.parse import urljoin
+from typing import Generator, Dict, Any, List, Optional
+from urllib.parse import urljoin, urlsplit
+
+from ..base import BaseSource, classify_room_type, run_async
+
+logger = logging.getLogger(__name__)
+
+# aiohttp is imported on first multi-page fetch; without it pages are fetched one by one
+HAS_AIOHTTP = importlib.util.find_spec('aiohttp') is not None
+
+# Brotli is only advertised when a decoder is installed for requests/aiohttp to use
+HAS_BROTLI = any(importlib.util.find_spec(name) is not None for name in ('brotli', 'brotlicffi'))
+
+MAX_CONCURRENT_FETCHES = 8
+MIN_REQUEST_INTERVAL = 0.2  # Seconds between requests to the same host
+
+# Transient failures retried by both the requests and the aiohttp fetch paths
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.3  # Seconds, doubled on each retry
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Size suffixes and resize parameters stripped to reach the original image,
+# matched in one pass; each named group maps to its replacement
+_HIRES_RE = re.compile(
+    r'(?P<size_underscore>_\d+x\d+\.)'
+    r'|(?P<size_dash>-\d+x\d+\.)'
+    r'|(?P<width_query>\?w=\d+.*$)'
+    r'|(?P<width_param>&w=\d+)'
+    r'|(?P<width_path>/w_\d+,)'
+)
+_HIRES_REPLACEMENTS = {
+    'size_underscore': '.',
+    'size_dash': '.',
+    'width_query': '',
+    'width_param': '',
+    'width_path': '/',
+}
+
+
+def _hires_replacement(match: re.Match) -> str:
+    return _HIRES_REPLACEMENTS[match.lastgroup]
+
+
+# Absolute srcset candidate with a width descriptor: "<url> <width>w"
+_SRCSET_RE = re.compile(r'(https?://[^\s,]+)\s+(\d+)w')
+
+
+def _sid(url: str) -> str:
+    """Stable 12-hex-char source ID for an image URL (hash() is salted per process)"""
+    return blake2b(url.encode(), digest_size=6).hexdigest()
+
+
+class DomainRateLimiter:
+    """
+    Spaces out requests to each host by a minimum interval.
+    Each caller reserves the next free slot for its host and sleeps until it,
+    so different hosts never wait on each other. A thread lock (held only for
+    the bookkeeping) lets sources on different threads and event loops share it.
+    """
+
+    def __init__(self, min_interval: float = MIN_REQUEST_INTERVAL):
+        self.min_interval = min_interval
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _reserve(self, url: str) -> float:
+        """Claim the next slot for the URL's host; returns seconds until it."""
+        domain = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(domain, 0.0))
+            self._next_slot[domain] = slot + self.min_interval
+        return slot - now
+
+    async def wait(self, url: str):
+        delay = self._reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
 
-from ..base import BaseSource, classify_room_type
+    def wait_sync(self, url: str):
+        delay = self._reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+
+_rate_limiter = DomainRateLimiter()
 
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
     'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br' if HAS_BROTLI else 'gzip, deflate',
 }
 
 
+# Raw page bodies kept between runs; listing pages rarely change within the hour
+PAGE_CACHE_DIR = Path(__file__).parent.parent.parent / "cache" / "pages"
+PAGE_CACHE_TTL = 3600
+
+
+class PageCache:
+    """
+    On-disk cache of page bodies, one file per URL (named by its blake2b hash).
+    Entries younger than ttl are served without a request; older ones are
+    revalidated with If-None-Match when the server sent an ETag.
+    """
+
+    def __init__(self, directory: Path = PAGE_CACHE_DIR, ttl: float = PAGE_CACHE_TTL):
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    def _path(self, url: str, suffix: str) -> Path:
+        return self.directory / (blake2b(url.encode(), digest_size=16).hexdigest() + suffix)
+
+    def fresh(self, url: str) -> Optional[bytes]:
+        """Cached body if it is younger than the TTL"""
+        path = self._path(url, '.html')
+        try:
+            if time.time() - path.stat().st_mtime < self.ttl:
+                return path.read_bytes() or None
+        except OSError:
+            pass
+        return None
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """If-None-Match header for a stale entry that has an ETag"""
+        try:
+            return {'If-None-Match': self._path(url, '.etag').read_text()}
+        except OSError:
+            return {}
+
+    def resolve(self, url: str, status: int, content: bytes, etag: Optional[str]) -> Optional[bytes]:
+        """
+        Body to use for a response: the cached one on 304, else the new one (stored).
+        None means a 304 arrived for a body that is no longer on disk; the ETag is
+        dropped so the caller can repeat the request unconditionally.
+        """
+        body_path = self._path(url, '.html')
+        etag_path = self._path(url, '.etag')
+        if status == 304:
+            try:
+                cached = body_path.read_bytes()
+            except OSError:
+                cached = b''
+            try:
+                if cached:
+                    body_path.touch()
+                else:
+                    etag_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return cached or None
+
+        # A cache that can't be written must not cost us a page we already have
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._write(body_path, content)
+            if etag:
+                self._write(etag_path, etag.encode())
+            else:
+                etag_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("  Could not cache %s: %s", url, e)
+        return content
+
+    @staticmethod
+    def _write(path: Path, data: bytes):
+        # Write then rename, so concurrent readers never see a partial file
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+
+_parser_state = threading.local()
+
+
+def _parse_html(content: bytes) -> lxml.html.HtmlElement:
+    """Parse page bytes (lxml sniffs the encoding) without building nodes no source reads"""
+    parser = getattr(_parser_state, 'parser', None)
+    if parser is None:
+        # Comments and processing instructions never match a selector, and nothing
+        # looks elements up by id. lxml parsers aren't thread-safe, hence one per thread.
+        parser = _parser_state.parser = lxml.html.HTMLParser(
+            remove_comments=True, remove_pis=True, collect_ids=False
+        )
+    return lxml.html.fromstring(content, parser=parser)
+
+
+def _css(selector: str) -> CSSSelector:
+    """Compile a CSS selector to XPath once, as HtmlElement.cssselect() would per call"""
+    return CSSSelector(selector, translator='html')
+
+
+def _first(element, selector: CSSSelector) -> Optional[lxml.html.HtmlElement]:
+    """First element matching a compiled selector, or None"""
+    matches = selector(element)
+    return matches[0] if matches else None
+
+
+def _first_attr(element, keys=('src', 'data-src', 'data-lazy-src')) -> Optional[str]:
+    """First non-empty attribute among keys (lazy-loaded images move src around)"""
+    get = element.get
+    for key in keys:
+        value = get(key)
+        if value:
+            return value
+    return None
+
+
+def _absolutize(base: str, url: str) -> str:
+    """Resolve url against base, skipping urljoin for absolute and protocol-relative URLs"""
+    if url.startswith(('http://', 'https://')):
+        return url
+    if url.startswith('//'):
+        return 'https:' + url
+    return urljoin(base, url)
+
+
+# Shared by every source that takes the first/each image of an article
+_SEL_IMG = _css('img')
+
+
 class SimpleBrandScraper(BaseSource):
     """Base class for simple request-based scrapers"""
 
@@ -29,28 +251,101 @@ class SimpleBrandScraper(BaseSource):
         self.session = requests.Session()
         self.session.headers.update(HEADERS)
 
-    def get_page(self, url: str) -> Optional[BeautifulSoup]:
+        # Keep connections alive across categories and retry transient errors
+        retry = Retry(total=MAX_RETRIES, backoff_factor=RETRY_BACKOFF, status_forcelist=RETRY_STATUSES)
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Set 'page_cache': False in config to always hit the network
+        self.cache = None
+        if self.config.get('page_cache', True):
+            self.cache = PageCache(ttl=self.config.get('page_cache_ttl', PAGE_CACHE_TTL))
+
+    def get_page(self, url: str) -> Optional[lxml.html.HtmlElement]:
         """Fetch and parse a page"""
         try:
-            resp = self.session.get(url, timeout=30)
-            resp.raise_for_status()
-            return BeautifulSoup(resp.text, 'html.parser')
+            content = self.cache.fresh(url) if self.cache else None
+            if content is None:
+                headers = self.cache.conditional_headers(url) if self.cache else None
+                content = self._download(url, headers)
+                if content is None:
+                    # 304 for a cached body that has since gone missing
+                    content = self._download(url, None)
+            return _parse_html(content)
         except Exception as e:
-            print(f"  Error fetching {url}: {e}")
+            logger.warning("  Error fetching %s: %s", url, e)
             return None
 
+    def _download(self, url: str, headers: Optional[Dict[str, str]]) -> Optional[bytes]:
+        _rate_limiter.wait_sync(url)
+        resp = self.session.get(url, timeout=30, headers=headers)
+        resp.raise_for_status()
+        if self.cache:
+            return self.cache.resolve(url, resp.status_code, resp.content, resp.headers.get('ETag'))
+        return resp.content
+
+    def get_pages(self, urls: List[str]) -> List[Optional[lxml.html.HtmlElement]]:
+        """Fetch and parse several pages concurrently, returned in the order given"""
+        if not HAS_AIOHTTP or len(urls) < 2:
+            return [self.get_page(url) for url in urls]
+        return run_async(self._fetch_all(urls))
+
+    async def _fetch_all(self, urls: List[str]) -> List[Optional[lxml.html.HtmlElement]]:
+        import aiohttp
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        loop = asyncio.get_running_loop()
+
+        async def download(http, url, headers):
+            # Same policy as the session's urllib3 Retry: transient statuses and
+            # connection errors are retried with exponential backoff
+            for attempt in range(MAX_RETRIES + 1):
+                if attempt:
+                    await asyncio.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+                await _rate_limiter.wait(url)
+                async with semaphore:
+                    try:
+                        async with http.get(url, headers=headers) as resp:
+                            if resp.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                                continue
+                            resp.raise_for_status()
+                            content = await resp.read()
+                            if self.cache:
+                                return self.cache.resolve(url, resp.status, content, resp.headers.get('ETag'))
+                            return content
+                    except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                        if attempt == MAX_RETRIES:
+                            raise
+
+        async def fetch(http, url):
+            content = self.cache.fresh(url) if self.cache else None
+            if content is None:
+                headers = self.cache.conditional_headers(url) if self.cache else None
+                try:
+                    content = await download(http, url, headers)
+                    if content is None:
+                        # 304 for a cached body that has since gone missing
+                        content = await download(http, url, None)
+                except Exception as e:
+                    logger.warning("  Error fetching %s: %s", url, e)
+                    return None
+
+            # lxml drops the GIL while parsing, so the default thread pool keeps
+            # parsing off the loop without pickling trees across processes.
+            try:
+                return await loop.run_in_executor(None, _parse_html, content)
+            except Exception as e:
+                logger.warning("  Error parsing %s: %s", url, e)
+                return None
+
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout) as http:
+            return await asyncio.gather(*(fetch(http, url) for url in urls))
+
     def extract_high_res_url(self, img_url: str) -> str:
         """Try to get highest resolution version of image"""
-        patterns = [
-            (r'_\d+x\d+\.', '.'),
-            (r'-\d+x\d+\.', '.'),
-            (r'\?w=\d+.*$', ''),
-            (r'&w=\d+', ''),
-            (r'/w_\d+,', '/'),
-        ]
-        for pattern, replacement in patterns:
-            img_url = re.sub(pattern, replacement, img_url)
-        return img_url
+        return _HIRES_RE.sub(_hires_replacement, img_url)
 
     def search(self, query: str, room_type: str = None, limit: int = 50) -> Generator[Dict, None, None]:
         """Override in subclass"""
@@ -63,50 +358,62 @@ class DesignMilkSource(SimpleBrandScraper):
     name = "designmilk"
     base_url = "https://design-milk.com"
 
+    _SEL_ARTICLE = _css('article.post')
+    _SEL_FEATURED_IMG = _css('img.wp-post-image, img.attachment-large')
+    _SEL_TITLE = _css('h2.entry-title a, .entry-title a')
+
+    CATEGORIES = (
+        '/category/interior-design/',
+        '/category/interior-design/living-spaces/',
+        '/category/interior-design/kitchens/',
+        '/category/interior-design/bedrooms-2/',
+        '/category/interior-design/bathrooms/',
+    )
+
     def search(self, query: str, room_type: str = None, limit: int = 50) -> Generator[Dict, None, None]:
         count = 0
-        categories = [
-            '/category/interior-design/',
-            '/category/interior-design/living-spaces/',
-            '/category/interior-design/kitchens/',
-            '/category/interior-design/bedrooms-2/',
-            '/category/interior-design/bathrooms/',
-        ]
+        seen = set()
+
+        docs = self.get_pages([f"{self.base_url}{cat_url}" for cat_url in self.CATEGORIES])
 
-        for cat_url in categories:
+        for cat_url, doc in zip(self.CATEGORIES, docs):
             if count >= limit:
                 break
 
-            soup = self.get_page(f"{self.base_url}{cat_url}")
-            if not soup:
+            if doc is None:
                 continue
 
-            for article in soup.select('article.post'):
+            for article in self._SEL_ARTICLE(doc):
                 if count >= limit:
                     break
 
-                img = article.select_one('img.wp-post-image, img.attachment-large')
-                if not img:
+                img = _first(article, self._SEL_FEATURED_IMG)
+                if img is None:
                     continue
 
-                img_url = img.get('src') or img.get('data-src')
+                img_url = _first_attr(img)
                 if not img_url:
                     continue
 
                 img_url = self.extract_high_res_url(img_url)
 
-                title_el = article.select_one('h2.entry-title a, .entry-title a')
-                title = title_el.text.strip() if title_el else ""
-                link = title_el.get('href') if title_el else ""
+                sid = img_url.split('/')[-1].split('.')[0][:50]
+                if sid in seen:
+                    continue
+
+                title_el = _first(article, self._SEL_TITLE)
+                title = title_el.text_content().strip() if title_el is not None else ""
+                link = title_el.get('href') if title_el is not None else ""
 
                 detected_room = classify_room_type(title + " " + (img.get('alt') or ''))
                 if room_type and detected_room != room_type:
                     continue
 
+                seen.add(sid)
                 count += 1
                 yield {
                     'source': self.name,
-                    'source_id': img_url.split('/')[-1].split('.')[0][:50],
+                    'source_id': sid,
                     'image_url': img_url,
                     'thumbnail_url': img_url,
                     'title': title[:200],
@@ -121,48 +428,59 @@ class YellowtraceLightSource(SimpleBrandScraper):
     name = "yellowtrace"
     base_url = "https://www.yellowtrace.com.au"
 
+    _SEL_ARTICLE = _css('article, .post-item')
+    _SEL_TITLE = _css('h2 a, h3 a, .entry-title a')
+    _SKIP_IMG_RE = re.compile(r'placeholder', re.I)
+
+    CATEGORIES = (
+        '/category/architecture-and-interiors/residential/',
+        '/category/architecture-and-interiors/hospitality/',
+        '/category/architecture-and-interiors/retail/',
+    )
+
     def search(self, query: str, room_type: str = None, limit: int = 50) -> Generator[Dict, None, None]:
         count = 0
-        categories = [
-            '/category/architecture-and-interiors/residential/',
-            '/category/architecture-and-interiors/hospitality/',
-            '/category/architecture-and-interiors/retail/',
-        ]
+        seen = set()
+
+        docs = self.get_pages([f"{self.base_url}{cat_url}" for cat_url in self.CATEGORIES])
 
-        for cat_url in categories:
+        for cat_url, doc in zip(self.CATEGORIES, docs):
             if count >= limit:
                 break
 
-            soup = self.get_page(f"{self.base_url}{cat_url}")
-            if not soup:
+            if doc is None:
                 continue
 
-            for article in soup.select('article, .post-item'):
+            for article in self._SEL_ARTICLE(doc):
                 if count >= limit:
                     break
 
-                img = article.select_one('img')
-                if not img:
+                img = _first(article, _SEL_IMG)
+                if img is None:
                     continue
 
-                img_url = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
-                if not img_url or 'placeholder' in img_url.lower():
+                img_url = _first_attr(img)
+                if not img_url or self._SKIP_IMG_RE.search(img_url):
                     continue
 
                 img_url = self.extract_high_res_url(img_url)
-                if not img_url.startswith('http'):
-                    img_url = urljoin(self.base_url, img_url)
+                img_url = _absolutize(self.base_url, img_url)
+
+                sid = _sid(img_url)
+                if sid in seen:
+                    continue
 
-                title_el = article.select_one('h2 a, h3 a, .entry-title a')
-                title = title_el.text.strip() if title_el else img.get('alt', '')
-                link = title_el.get('href') if title_el else ''
+                title_el = _first(article, self._SEL_TITLE)
+                title = title_el.text_content().strip() if title_el is not None else img.get('alt', '')
+                link = title_el.get('href') if title_el is not None else ''
 
                 detected_room = classify_room_type(title)
 
+                seen.add(sid)
                 count += 1
                 yield {
                     'source': self.name,
-                    'source_id': str(hash(img_url))[:12],
+                    'source_id': sid,
                     'image_url': img_url,
                     'thumbnail_url': img_url,
                     'title': title[:200],
@@ -177,68 +495,87 @@ class DezeenSimpleSource(SimpleBrandScraper):
     name = "dezeen"
     base_url = "https://www.dezeen.com"
 
+    _SEL_ARTICLE = _css('article, .dezeen-post, li[class*="post"]')
+    _SEL_TITLE = _css('h3 a, h2 a, .dezeen-post-title a')
+    _SKIP_IMG_RE = re.compile(r'placeholder', re.I)
+
+    # Listings that already imply a room; the rest are classified per article
+    CATEGORY_ROOM = {
+        '/interiors/kitchen-interiors/': 'kitchen',
+        '/interiors/bathroom-interiors/': 'bathroom',
+        '/interiors/living-room-interiors/': 'living_room',
+        '/interiors/bedroom-interiors/': 'bedroom',
+    }
+
+    CATEGORIES = (
+        '/interiors/',
+        '/interiors/residential-interiors/',
+        '/interiors/kitchen-interiors/',
+        '/interiors/bathroom-interiors/',
+        '/interiors/living-room-interiors/',
+        '/interiors/bedroom-interiors/',
+    )
+
     def search(self, query: str, room_type: str = None, limit: int = 50) -> Generator[Dict, None, None]:
         count = 0
-        urls = [
-            '/interiors/',
-            '/interiors/residential-interiors/',
-            '/interiors/kitchen-interiors/',
-            '/interiors/bathroom-interiors/',
-            '/interiors/living-room-interiors/',
-            '/interiors/bedroom-interiors/',
-        ]
+        seen = set()
+        urls = self.CATEGORIES
+        if room_type:
+            # Don't fetch listings for a different room
+            urls = [url_path for url_path in urls if self.CATEGORY_ROOM.get(url_path, room_type) == room_type]
 
-        for url_path in urls:
+        docs = self.get_pages([f"{self.base_url}{url_path}" for url_path in urls])
+
+        for url_path, doc in zip(urls, docs):
             if count >= limit:
                 break
 
-            soup = self.get_page(f"{self.base_url}{url_path}")
-            if not soup:
+            if doc is None:
                 continue
 
-            for article in soup.select('article, .dezeen-post, li[class*="post"]'):
+            # Room implied by the listing path, worked out once per page
+            path_room = self.CATEGORY_ROOM.get(url_path) or classify_room_type(url_path)
+
+            for article in self._SEL_ARTICLE(doc):
                 if count >= limit:
                     break
 
-                img = article.select_one('img')
-                if not img:
+                img = _first(article, _SEL_IMG)
+                if img is None:
                     continue
 
-                srcset = img.get('srcset', '')
-                img_url = None
-
-                if srcset:
-                    parts = srcset.split(',')
-                    best_width = 0
-                    for part in parts:
-                        match = re.search(r'(https?://[^\s]+)\s+(\d+)w', part.strip())
-                        if match:
-                            url, width = match.groups()
-                            if int(width) > best_width:
-                                best_width = int(width)
-                                img_url = url
+                # Widest srcset candidate, found in one pass over the attribute
+                candidates = _SRCSET_RE.findall(img.get('srcset', ''))
+                img_url = max((int(width), url) for url, width in candidates)[1] if candidates else None
 
                 if not img_url:
-                    img_url = img.get('src') or img.get('data-src')
+                    img_url = _first_attr(img)
 
-                if not img_url or 'placeholder' in img_url.lower():
+                if not img_url or self._SKIP_IMG_RE.search(img_url):
                     continue
 
-                title_el = article.select_one('h3 a, h2 a, .dezeen-post-title a')
-                title = title_el.text.strip() if title_el else img.get('alt', '')
-                link = title_el.get('href') if title_el else ''
+                sid = _sid(img_url)
+                if sid in seen:
+                    continue
+
+                title_el = _first(article, self._SEL_TITLE)
+                title = title_el.text_content().strip() if title_el is not None else img.get('alt', '')
+                link = title_el.get('href') if title_el is not None else ''
 
-                if link and not link.startswith('http'):
-                    link = urljoin(self.base_url, link)
+                if link:
+                    link = _absolutize(self.base_url, link)
 
-                detected_room = classify_room_type(title + " " + url_path)
+                detected_room = path_room
+                if detected_room == 'other':
+                    detected_room = classify_room_type(title) or 'other'
                 if room_type and detected_room != room_type:
                     continue
 
+                seen.add(sid)
                 count += 1
                 yield {
                     'source': self.name,
-                    'source_id': str(hash(img_url))[:12],
+                    'source_id': sid,
                     'image_url': img_url,
                     'thumbnail_url': img_url,
                     'title': title[:200],
@@ -253,52 +590,61 @@ class ArchDailySimpleSource(SimpleBrandScraper):
     name = "archdaily"
     base_url = "https://www.archdaily.com"
 
+    _SEL_ARTICLE = _css('article, .afd-search-list__item, li[data-url]')
+    _SEL_TITLE = _css('h2, h3, .afd-title')
+    _SEL_LINK = _css('a[href*="/"]')
+
     def search(self, query: str, room_type: str = None, limit: int = 50) -> Generator[Dict, None, None]:
         count = 0
+        seen = set()
         search_url = f"{self.base_url}/search/projects/categories/houses?q={query}"
-        soup = self.get_page(search_url)
+        doc = self.get_page(search_url)
 
-        if not soup:
-            soup = self.get_page(f"{self.base_url}/search/projects?q=scandinavian+interior")
+        if doc is None:
+            doc = self.get_page(f"{self.base_url}/search/projects?q=scandinavian+interior")
 
-        if not soup:
+        if doc is None:
             return
 
-        for article in soup.select('article, .afd-search-list__item, li[data-url]'):
+        for article in self._SEL_ARTICLE(doc):
             if count >= limit:
                 break
 
-            img = article.select_one('img')
-            if not img:
+            img = _first(article, _SEL_IMG)
+            if img is None:
                 continue
 
-            img_url = img.get('data-src') or img.get('src') or img.get('data-lazy-src')
+            img_url = _first_attr(img, ('data-src', 'src', 'data-lazy-src'))
             if not img_url:
                 continue
 
             if 'thumbor' in img_url or 'images.adsttc' in img_url:
                 img_url = re.sub(r'/\d+x\d+_', '/', img_url)
 
-            if not img_url.startswith('http'):
-                img_url = urljoin(self.base_url, img_url)
+            img_url = _absolutize(self.base_url, img_url)
 
-            title_el = article.select_one('h2, h3, .afd-title')
-            title = title_el.text.strip() if title_el else img.get('alt', '')
+            sid = _sid(img_url)
+            if sid in seen:
+                continue
+
+            title_el = _first(article, self._SEL_TITLE)
+            title = title_el.text_content().strip() if title_el is not None else img.get('alt', '')
 
             link = article.get('data-url') or ''
             if not link:
-                link_el = article.select_one('a[href*="/"]')
-                link = link_el.get('href', '') if link_el else ''
+                link_el = _first(article, self._SEL_LINK)
+                link = link_el.get('href', '') if link_el is not None else ''
 
-            if link and not link.startswith('http'):
-                link = urljoin(self.base_url, link)
+            if link:
+                link = _absolutize(self.base_url, link)
 
             detected_room = classify_room_type(title)
 
+            seen.add(sid)
             count += 1
             yield {
                 'source': self.name,
-                'source_id': str(hash(img_url))[:12],
+                'source_id': sid,
                 'image_url': img_url,
                 'thumbnail_url': img_url,
                 'title': title[:200],
@@ -313,35 +659,61 @@ class NordroomSource(SimpleBrandScraper):
     name = "nordroom"
     base_url = "https://www.thenordroom.com"
 
+    _SEL_ARTICLE = _css('article, .post')
+    _SEL_TITLE = _css('h2 a, .entry-title a')
+    _SKIP_IMG_RE = re.compile(r'avatar|logo', re.I)
+
+    # Listings that already imply a room; the rest are classified per image
+    CATEGORY_ROOM = {
+        '/category/living-room/': 'living_room',
+        '/category/bedroom/': 'bedroom',
+        '/category/kitchen/': 'kitchen',
+        '/category/bathroom/': 'bathroom',
+    }
+
+    CATEGORIES = (
+        '/category/living-room/',
+        '/category/bedroom/',
+        '/category/kitchen/',
+        '/category/bathroom/',
+        '/category/scandinavian-interior/',
+        '/category/home-tour/',
+    )
+
     def search(self, query: str, room_type: str = None, limit: int = 50) -> Generator[Dict, None, None]:
         count = 0
-        categories = [
-            '/category/living-room/',
-            '/category/bedroom/',
-            '/category/kitchen/',
-            '/category/bathroom/',
-            '/category/scandinavian-interior/',
-            '/category/home-tour/',
-        ]
+        seen = set()
+        categories = self.CATEGORIES
+        if room_type:
+            # Don't fetch listings for a different room
+            categories = [cat_url for cat_url in categories if self.CATEGORY_ROOM.get(cat_url, room_type) == room_type]
+
+        docs = self.get_pages([f"{self.base_url}{cat_url}" for cat_url in categories])
 
-        for cat_url in categories:
+        for cat_url, doc in zip(categories, docs):
             if count >= limit:
                 break
 
-            soup = self.get_page(f"{self.base_url}{cat_url}")
-            if not soup:
+            if doc is None:
                 continue
 
-            for article in soup.select('article, .post'):
+            category_room = self.CATEGORY_ROOM.get(cat_url)
+
+            for article in self._SEL_ARTICLE(doc):
                 if count >= limit:
                     break
 
-                for img in article.select('img'):
+                # Title and link are per article, not per image
+                title_el = _first(article, self._SEL_TITLE)
+                article_title = title_el.text_content().strip() if title_el is not None else None
+                link = title_el.get('href') if title_el is not None else ''
+
+                for img in _SEL_IMG(article):
                     if count >= limit:
                         break
 
-                    img_url = img.get('src') or img.get('data-src')
-                    if not img_url or 'avatar' in img_url.lower() or 'logo' in img_url.lower():
+                    img_url = _first_attr(img)
+                    if not img_url or self._SKIP_IMG_RE.search(img_url):
                         continue
 
                     width = img.get('width', '0')
@@ -352,32 +724,23 @@ class NordroomSource(SimpleBrandScraper):
                         pass
 
                     img_url = self.extract_high_res_url(img_url)
-                    if not img_url.startswith('http'):
-                        img_url = urljoin(self.base_url, img_url)
-
-                    title_el = article.select_one('h2 a, .entry-title a')
-                    title = title_el.text.strip() if title_el else img.get('alt', '')
-                    link = title_el.get('href') if title_el else ''
-
-                    detected_room = 'other'
-                    if 'living' in cat_url:
-                        detected_room = 'living_room'
-                    elif 'bedroom' in cat_url:
-                        detected_room = 'bedroom'
-                    elif 'kitchen' in cat_url:
-                        detected_room = 'kitchen'
-                    elif 'bathroom' in cat_url:
-                        detected_room = 'bathroom'
-                    else:
-                        detected_room = classify_room_type(title) or 'other'
+                    img_url = _absolutize(self.base_url, img_url)
+
+                    sid = _sid(img_url)
+                    if sid in seen:
+                        continue
+
+                    title = article_title if article_title is not None else img.get('alt', '')
+                    detected_room = category_room or classify_room_type(title) or 'other'
 
                     if room_type and detected_room != room_type:
                         continue
 
+                    seen.add(sid)
                     count += 1
                     yield {
                         'source': self.name,
-                        'source_id': str(hash(img_url))[:12],
+                        'source_id': sid,
                         'image_url': img_url,
                         'thumbnail_url': img_url,
                         'title': title[:200],
@@ -392,52 +755,64 @@ class CocoLapineSource(SimpleBrandScraper):
     name = "cocolapine"
     base_url = "https://cocolapinedesign.com"
 
+    _SEL_ARTICLE = _css('article, .post, .entry')
+    _SEL_FEATURED_IMG = _css('img.wp-post-image, img.attachment-large, img[src*="upload"]')
+    _SEL_TITLE = _css('h2 a, h3 a, .entry-title a')
+    _SKIP_IMG_RE = re.compile(r'avatar')
+
+    CATEGORIES = (
+        '/category/interior/',
+        '/category/interiors/',
+        '/category/home-tour/',
+        '/',
+    )
+
     def search(self, query: str, room_type: str = None, limit: int = 50) -> Generator[Dict, None, None]:
         count = 0
-        pages = [
-            '/category/interior/',
-            '/category/interiors/',
-            '/category/home-tour/',
-            '/',
-        ]
+        seen = set()
+
+        docs = self.get_pages([f"{self.base_url}{page_url}" for page_url in self.CATEGORIES])
 
-        for page_url in pages:
+        for page_url, doc in zip(self.CATEGORIES, docs):
             if count >= limit:
                 break
 
-            soup = self.get_page(f"{self.base_url}{page_url}")
-            if not soup:
+            if doc is None:
                 continue
 
-            for article in soup.select('article, .post, .entry'):
+            for article in self._SEL_ARTICLE(doc):
                 if count >= limit:
                     break
 
-                img = article.select_one('img.wp-post-image, img.attachment-large, img[src*="upload"]')
-                if not img:
-                    img = article.select_one('img')
+                img = _first(article, self._SEL_FEATURED_IMG)
+                if img is None:
+                    img = _first(article, _SEL_IMG)
 
-                if not img:
+                if img is None:
                     continue
 
-                img_url = img.get('src') or img.get('data-src')
-                if not img_url or 'gravatar' in img_url or 'avatar' in img_url:
+                img_url = _first_attr(img)
+                if not img_url or self._SKIP_IMG_RE.search(img_url):
                     continue
 
                 img_url = self.extract_high_res_url(img_url)
-                if not img_url.startswith('http'):
-                    img_url = urljoin(self.base_url, img_url)
+                img_url = _absolutize(self.base_url, img_url)
 
-                title_el = article.select_one('h2 a, h3 a, .entry-title a')
-                title = title_el.text.strip() if title_el else img.get('alt', '')
-                link = title_el.get('href') if title_el else ''
+                sid = _sid(img_url)
+                if sid in seen:
+                    continue
+
+                title_el = _first(article, self._SEL_TITLE)
+                title = title_el.text_content().strip() if title_el is not None else img.get('alt', '')
+                link = title_el.get('href') if title_el is not None else ''
 
                 detected_room = classify_room_type(title) or 'other'
 
+                seen.add(sid)
                 count += 1
                 yield {
                     'source': self.name,
-                    'source_id': str(hash(img_url))[:12],
+                    'source_id': sid,
                     'image_url': img_url,
                     'thumbnail_url': img_url,
                     'title': title[:200],
@@ -452,47 +827,56 @@ class MyScandinavianHomeSource(SimpleBrandScraper):
     name = "myscandinavianhome"
     base_url = "https://www.myscandinavianhome.com"
 
+    _SEL_ARTICLE = _css('article, .post-outer, .blog-post')
+    _SEL_TITLE = _css('h2 a, h3 a, .post-title a')
+    _SKIP_IMG_RE = re.compile(r'icon|logo', re.I)
+
     def search(self, query: str, room_type: str = None, limit: int = 50) -> Generator[Dict, None, None]:
         count = 0
-        soup = self.get_page(f"{self.base_url}/search?q={query}")
-        if not soup:
-            soup = self.get_page(self.base_url)
+        seen = set()
+        doc = self.get_page(f"{self.base_url}/search?q={query}")
+        if doc is None:
+            doc = self.get_page(self.base_url)
 
-        if not soup:
+        if doc is None:
             return
 
-        for article in soup.select('article, .post-outer, .blog-post'):
+        for article in self._SEL_ARTICLE(doc):
             if count >= limit:
                 break
 
-            for img in article.select('img'):
+            for img in _SEL_IMG(article):
                 if count >= limit:
                     break
 
-                img_url = img.get('src') or img.get('data-src')
+                img_url = _first_attr(img)
                 if not img_url:
                     continue
 
-                if 'icon' in img_url.lower() or 'logo' in img_url.lower():
+                if self._SKIP_IMG_RE.search(img_url):
                     continue
 
                 if 'blogspot' in img_url:
                     img_url = re.sub(r'/s\d+/', '/s1600/', img_url)
                     img_url = re.sub(r'/w\d+-h\d+/', '/s1600/', img_url)
 
-                if not img_url.startswith('http'):
-                    img_url = urljoin(self.base_url, img_url)
+                img_url = _absolutize(self.base_url, img_url)
+
+                sid = _sid(img_url)
+                if sid in seen:
+                    continue
 
-                title_el = article.select_one('h2 a, h3 a, .post-title a')
-                title = title_el.text.strip() if title_el else img.get('alt', '')
-                link = title_el.get('href') if title_el else ''
+                title_el = _first(article, self._SEL_TITLE)
+                title = title_el.text_content().strip() if title_el is not None else img.get('alt', '')
+                link = title_el.get('href') if title_el is not None else ''
 
                 detected_room = classify_room_type(title) or 'other'
 
+                seen.add(sid)
                 count += 1
                 yield {
                     'source': self.name,
-                    'source_id': str(hash(img_url))[:12],
+                    'source_id': sid,
                     'image_url': img_url,
                     'thumbnail_url': img_url,
                     'title': title[:200],
@@ -520,22 +904,32 @@ class AllSimpleSourcesCombined(BaseSource):
         total = 0
         per_source_limit = max(10, limit // len(sources))
 
-        for source in sources:
-            if total >= limit:
-                break
+        # Every source is a different site, so they can all run at once;
+        # results are yielded source by source as each one finishes
+        executor = ThreadPoolExecutor(max_workers=len(sources))
+        try:
+            futures = {}
+            for source in sources:
+                logger.info("  Scraping %s...", source.name)
+                futures[executor.submit(list, source.search(query, room_type, per_source_limit))] = source
+
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    logger.warning("    %s error: %s", source.name, e)
+                    continue
 
-            print(f"  Scraping {source.name}...")
-            source_count = 0
-            try:
-                for result in source.search(query, room_type, per_source_limit):
-                    if total >= limit:
-                        break
-                    source_count += 1
+                logger.info("    %s: found %d images", source.name, len(results))
+                for result in results[:limit - total]:
                     total += 1
                     yield result
-                print(f"    Found {source_count} images")
-            except Exception as e:
-                print(f"    Error: {e}")
+                if total >= limit:
+                    break
+        finally:
+            # Don't wait for slower sources once the limit is reached
+            executor.shutdown(wait=False, cancel_futures=True)
 
 
 # Export all sources